@@ -1,7 +1,21 @@
 #!/usr/bin/env python3
 import argparse
+import subprocess
 import sys
 from hotspot_manager import ConcurrentHotspotManager, HotspotConfig, HardwareDetector
+from hotspot_manager.hotspot_manager import resolve_command
+
+
+def _run_lines(cmd):
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    try:
+        for line in proc.stdout:
+            yield line.rstrip("\n")
+    finally:
+        proc.stdout.close()
+        proc.wait()
 
 
 def cmd_status(manager, detector):
@@ -31,7 +45,7 @@ def cmd_status(manager, detector):
     print()
 
 
-def cmd_start(manager, args):
+def cmd_start(manager, detector, args):
     if not args.ssid:
         print("Error: SSID required. Use --ssid")
         return 1
@@ -40,19 +54,16 @@ def cmd_start(manager, args):
         print("Error: Password must be at least 8 characters")
         return 1
 
-    detector = HardwareDetector()
-    interfaces = detector.get_wifi_interfaces()
-
     interface = args.interface
     if not interface:
-        connected = [i for i in interfaces if i.connected]
-        if connected:
-            interface = connected[0].name
-        elif interfaces:
-            interface = interfaces[0].name
-        else:
+        names = detector.list_interface_names()
+        if not names:
             print("Error: No WiFi interfaces found")
             return 1
+        interface = next(
+            (name for name in names if detector.is_interface_connected(name)),
+            names[0],
+        )
 
     config = HotspotConfig(
         ssid=args.ssid,
@@ -94,18 +105,15 @@ def cmd_interfaces(detector):
         print(f"  Connected: {'Yes' if iface.connected else 'No'}")
 
     print("\n=== Ethernet Interfaces ===")
-    import subprocess
-
     try:
-        result = subprocess.run(
-            ["nmcli", "-t", "-f", "DEVICE,TYPE,STATE", "device", "status"],
-            capture_output=True,
-            text=True,
-        )
-        for line in result.stdout.splitlines():
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[1] == "ethernet":
-                print(f"\n{parts[0]}: {parts[2]}")
+        nmcli = resolve_command("nmcli")
+        for line in _run_lines(
+            [nmcli, "-t", "-f", "DEVICE,TYPE,STATE", "device", "status"]
+        ):
+            device, _, rest = line.partition(":")
+            dev_type, _, state = rest.partition(":")
+            if dev_type == "ethernet":
+                print(f"\n{device}: {state}")
     except Exception:
         pass
     print()
@@ -140,7 +148,7 @@ def main():
     if args.command == "status":
         cmd_status(manager, detector)
     elif args.command == "start":
-        sys.exit(cmd_start(manager, args))
+        sys.exit(cmd_start(manager, detector, args))
     elif args.command == "stop":
         sys.exit(cmd_stop(manager))
     elif args.command == "interfaces":
@@ -1,13 +1,26 @@
 #!/usr/bin/env python3
 import subprocess
-import re
+import functools
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 import logging
 
+from .hotspot_manager import resolve_command
+from .nm_client import NetworkManagerClient, NM_802_11_MODE_AP, NM_802_11_MODE_INFRA
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SYSFS_NET = "/sys/class/net"
+
+
+@functools.lru_cache(maxsize=None)
+def _network_manager_version() -> Optional[str]:
+    return NetworkManagerClient().get_version()
+
 
 @dataclass
 class WifiInterface:
@@ -23,161 +36,161 @@ class WifiInterface:
 class HardwareDetector:
     def __init__(self):
         self.interfaces: List[WifiInterface] = []
+        self._phy_caps: Dict[int, Tuple[bool, bool]] = {}
+        self._nm = NetworkManagerClient()
 
-    def get_wifi_interfaces(self) -> List[WifiInterface]:
-        self.interfaces = []
+    def list_interface_names(self) -> List[str]:
         try:
-            iw_result = subprocess.run(
-                ["iw", "dev"], capture_output=True, text=True, check=True
-            )
-            current_if = None
-            current_phy = None
-
-            for line in iw_result.stdout.splitlines():
-                if line.strip().startswith("Interface"):
-                    if current_if:
-                        self._finalize_interface(current_if)
-                    current_if = {
-                        "name": line.split()[-1],
-                        "phy": current_phy,
-                        "modes": [],
-                    }
-                elif line.strip().startswith("wiphy"):
-                    current_phy = int(line.split()[-1])
-                    if current_if:
-                        current_if["phy"] = current_phy
-
-            if current_if:
-                self._finalize_interface(current_if)
+            names = sorted(os.listdir(SYSFS_NET))
+        except OSError as e:
+            logger.error(f"Failed to get wifi interfaces: {e}")
+            return []
+        return [n for n in names if os.path.isdir(f"{SYSFS_NET}/{n}/phy80211")]
+
+    def is_interface_connected(self, name: str) -> bool:
+        device = self._nm.get_device(name)
+        return bool(device and device.connected)
 
+    def get_wifi_interfaces(self, refresh_hw: bool = True) -> List[WifiInterface]:
+        if not refresh_hw and self.interfaces:
+            # Hardware capabilities don't change; only link state needs a reread
             for iface in self.interfaces:
-                self._check_ap_support(iface)
                 self._check_current_state(iface)
-
             return self.interfaces
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to get wifi interfaces: {e}")
-            return []
 
-    def _finalize_interface(self, iface_data: dict):
-        driver = self._get_driver(iface_data["name"])
-        self.interfaces.append(
-            WifiInterface(
-                name=iface_data["name"],
-                driver=driver,
-                supports_ap=False,
-                supports_concurrent=False,
-                phy_number=iface_data.get("phy", 0),
-                current_mode="unknown",
-                connected=False,
-            )
+        self.interfaces = []
+        for name in self.list_interface_names():
+            iface = self._make_interface(name)
+            if iface:
+                self.interfaces.append(iface)
+
+        first_per_phy: Dict[int, WifiInterface] = {}
+        for iface in self.interfaces:
+            first_per_phy.setdefault(iface.phy_number, iface)
+
+        # Probes only wait on subprocesses / D-Bus, so run them side by side
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [
+                pool.submit(self._check_ap_support, iface)
+                for iface in first_per_phy.values()
+            ]
+            futures += [
+                pool.submit(self._check_current_state, iface)
+                for iface in self.interfaces
+            ]
+            for future in futures:
+                future.result()
+
+        for iface in self.interfaces:
+            if first_per_phy[iface.phy_number] is not iface:
+                self._check_ap_support(iface)
+
+        return self.interfaces
+
+    @staticmethod
+    def _read_phy_index(interface: str) -> Optional[int]:
+        try:
+            with open(f"{SYSFS_NET}/{interface}/phy80211/index") as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _make_interface(self, name: str) -> Optional[WifiInterface]:
+        phy = self._read_phy_index(name)
+        if phy is None:
+            return None
+        return WifiInterface(
+            name=name,
+            driver=self._get_driver(name),
+            supports_ap=False,
+            supports_concurrent=False,
+            phy_number=phy,
+            current_mode="unknown",
+            connected=False,
         )
 
-    def _get_driver(self, interface: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_driver(interface: str) -> str:
         try:
-            result = subprocess.run(
-                ["readlink", "-f", f"/sys/class/net/{interface}/device/driver"],
-                capture_output=True,
-                text=True,
+            return os.path.basename(
+                os.readlink(f"{SYSFS_NET}/{interface}/device/driver")
             )
-            if result.returncode == 0:
-                return result.stdout.strip().split("/")[-1]
-        except Exception:
-            pass
-        return "unknown"
+        except OSError:
+            return "unknown"
 
     def _check_ap_support(self, iface: WifiInterface):
-        try:
-            result = subprocess.run(
-                ["iw", "phy", f"phy{iface.phy_number}", "info"],
-                capture_output=True,
-                text=True,
-            )
+        caps = self._phy_caps.get(iface.phy_number)
+        if caps is None:
+            try:
+                result = subprocess.run(
+                    [resolve_command("iw"), "phy", f"phy{iface.phy_number}", "info"],
+                    capture_output=True,
+                    text=True,
+                )
+            except OSError:
+                iface.supports_ap = False
+                iface.supports_concurrent = False
+                return
 
             output = result.stdout
-            iface.supports_ap = "* AP" in output
-
+            supports_ap = "* AP" in output
             has_ap_vlan = "* AP/VLAN" in output
             has_managed = "* managed" in output
-            iface.supports_concurrent = (
-                iface.supports_ap and has_ap_vlan and has_managed
-            )
+            caps = (supports_ap, supports_ap and has_ap_vlan and has_managed)
+            if result.returncode == 0:
+                self._phy_caps[iface.phy_number] = caps
 
-            if iface.supports_concurrent:
-                logger.info(f"{iface.name} supports concurrent mode (AP + managed)")
-            elif iface.supports_ap:
-                logger.info(f"{iface.name} supports AP mode (can create hotspot)")
+        iface.supports_ap, iface.supports_concurrent = caps
 
-        except subprocess.CalledProcessError:
-            iface.supports_ap = False
-            iface.supports_concurrent = False
+        if iface.supports_concurrent:
+            logger.info(f"{iface.name} supports concurrent mode (AP + managed)")
+        elif iface.supports_ap:
+            logger.info(f"{iface.name} supports AP mode (can create hotspot)")
 
     def _check_current_state(self, iface: WifiInterface):
         try:
-            nmcli_result = subprocess.run(
-                ["nmcli", "-t", "-f", "DEVICE,STATE,CONNECTION", "device", "status"],
-                capture_output=True,
-                text=True,
-            )
-
-            for line in nmcli_result.stdout.splitlines():
-                parts = line.split(":")
-                if len(parts) >= 2 and parts[0] == iface.name:
-                    state = parts[1]
-                    iface.connected = state in ["connected", "connected (externally)"]
-                    if "Hotspot" in line or "ap" in line.lower():
-                        iface.current_mode = "hotspot"
-                    elif iface.connected:
-                        iface.current_mode = "managed"
-                    break
+            device = self._nm.get_device(iface.name)
+            if device and device.managed:
+                iface.connected = device.connected
+                mode = self._nm.get_wireless_mode(device)
+                if mode == NM_802_11_MODE_AP:
+                    iface.current_mode = "hotspot"
+                elif mode == NM_802_11_MODE_INFRA:
+                    iface.current_mode = "managed"
+                return
 
             iw_result = subprocess.run(
-                ["iw", "dev", iface.name, "info"], capture_output=True, text=True
+                [resolve_command("iw"), "dev", iface.name, "info"],
+                capture_output=True,
+                text=True,
             )
 
             if "type AP" in iw_result.stdout:
                 iface.current_mode = "hotspot"
             elif "type managed" in iw_result.stdout:
-                if iface.current_mode != "hotspot":
-                    iface.current_mode = "managed"
+                iface.current_mode = "managed"
 
         except Exception as e:
             logger.error(f"Error checking state for {iface.name}: {e}")
 
     def get_connected_wifi(self) -> Optional[str]:
-        try:
-            result = subprocess.run(
-                ["nmcli", "-t", "-f", "ACTIVE,SSID", "dev", "wifi"],
-                capture_output=True,
-                text=True,
-            )
-            for line in result.stdout.splitlines():
-                if line.startswith("yes:"):
-                    return line.split(":", 1)[1] if ":" in line else None
-        except Exception:
-            pass
+        for device in self._nm.get_devices():
+            if device.is_wifi and device.connected:
+                ssid = self._nm.get_active_ssid(device)
+                if ssid:
+                    return ssid
         return None
 
-    def check_hostapd_available(self) -> bool:
-        try:
-            subprocess.run(["which", "hostapd"], check=True, capture_output=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def check_hostapd_available() -> bool:
+        return shutil.which("hostapd") is not None
 
-    def check_dnsmasq_available(self) -> bool:
-        try:
-            subprocess.run(["which", "dnsmasq"], check=True, capture_output=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def check_dnsmasq_available() -> bool:
+        return shutil.which("dnsmasq") is not None
 
     def get_network_manager_version(self) -> Optional[str]:
-        try:
-            result = subprocess.run(
-                ["nmcli", "--version"], capture_output=True, text=True
-            )
-            match = re.search(r"(\d+\.\d+\.\d+)", result.stdout)
-            return match.group(1) if match else None
-        except Exception:
-            return None
+        return _network_manager_version()
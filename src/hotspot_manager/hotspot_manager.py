@@ -1,24 +1,100 @@
 #!/usr/bin/env python3
 import subprocess
+import functools
+import hashlib
 import json
-import re
 import os
 import logging
 import time
 import signal
-from typing import Optional, Dict, List, Tuple
-from dataclasses import dataclass
+import shutil
+from typing import Optional, Dict, Iterator, List, Tuple
+from dataclasses import dataclass, asdict
 from pathlib import Path
-import threading
 import socket
 import fcntl
 import struct
 
+from gi.repository import GLib
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .nm_client import NetworkManagerClient, NM_DEVICE_STATE_ACTIVATED
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+HOSTAPD_CTRL_DIR = "/var/run/hostapd"
+DNSMASQ_PID_FILE = "/tmp/hotspot-dnsmasq.pid"
+SIOCGIFADDR = 0x8915
+SYSFS_NET = "/sys/class/net"
+IPTABLES_RULES = (
+    ("nat", "POSTROUTING -j MASQUERADE"),
+    ("filter", "FORWARD -j ACCEPT"),
+)
+
+_HOSTAPD_TMPL = """interface={interface}
+driver=nl80211
+ssid={ssid}
+hw_mode={hw_mode}
+channel={channel}
+ieee80211n=1
+wmm_enabled=1
+ht_capab=[HT40+][SHORT-GI-40]
+auth_algs=1
+wpa=2
+wpa_key_mgmt=WPA-PSK
+rsn_pairwise=CCMP
+wpa_passphrase={password}
+ctrl_interface={ctrl_interface}
+"""
+
+_DNSMASQ_TMPL = """interface={interface}
+bind-interfaces
+dhcp-range={ip_range_start},{ip_range_end},12h
+dhcp-option=3,{gateway}
+dhcp-option=6,8.8.8.8,8.8.4.4
+domain=local
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_command(name: str) -> str:
+    path = shutil.which(name)
+    if path is None:
+        logger.warning(f"{name} not found in PATH")
+    return path or name
+
 
-@dataclass
+def _read_phy(interface: str) -> Optional[int]:
+    try:
+        with open(f"{SYSFS_NET}/{interface}/phy80211/name") as f:
+            return int(f.read().strip()[len("phy") :])
+    except (OSError, ValueError):
+        return None
+
+
+def _find_pids(comm: str, marker: bytes) -> List[int]:
+    pids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/comm") as f:
+                if f.read().strip() != comm:
+                    continue
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                if marker in f.read():
+                    pids.append(int(entry))
+        except OSError:
+            pass
+    return pids
+
+
+@dataclass(frozen=True)
 class HotspotConfig:
     ssid: str
     password: str
@@ -35,13 +111,20 @@ class ConcurrentHotspotManager:
     def __init__(self):
         self.hotspot_active = False
         self.current_config: Optional[HotspotConfig] = None
-        self._monitor_thread = None
-        self._stop_monitor = threading.Event()
+        self._hostapd_watch_id = None
+        self._dnsmasq_watch_id = None
+        self._hostapd_ctrl: Optional[socket.socket] = None
+        self._hostapd_ctrl_path = None
+        self._hostapd_ctrl_watch_id = None
+        self._nm_subscription_id = None
+        self._internet_interface = None
+        self._gateway_prefix = ""
         self._callbacks: List[callable] = []
         self._virtual_interface = None
         self._hostapd_process = None
         self._dnsmasq_process = None
         self._method_used = None
+        self._nm = NetworkManagerClient()
 
     def register_callback(self, callback: callable):
         self._callbacks.append(callback)
@@ -54,103 +137,173 @@ class ConcurrentHotspotManager:
                 logger.error(f"Callback error: {e}")
 
     def _run_cmd(
-        self, cmd: List[str], check: bool = False
+        self,
+        cmd: List[str],
+        check: bool = False,
+        input: Optional[str] = None,
+        capture: bool = True,
     ) -> subprocess.CompletedProcess:
         logger.debug(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        if capture:
+            result = subprocess.run(cmd, input=input, capture_output=True, text=True)
+        else:
+            result = subprocess.run(
+                cmd,
+                input=input,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                text=input is not None,
+            )
         if check and result.returncode != 0:
-            logger.error(f"Command failed: {result.stderr}")
+            logger.error(f"Command failed: {result.stderr or ' '.join(cmd)}")
         return result
 
-    def get_connected_wifi_ssid(self) -> Optional[str]:
+    def _run_parallel(self, cmds: List[Tuple[List[str], Optional[str]]]) -> List[int]:
+        procs = []
+        for cmd, input in cmds:
+            logger.debug(f"Running: {' '.join(cmd)}")
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE if input is not None else subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError as e:
+                logger.error(f"Failed to run {cmd[0]}: {e}")
+                procs.append(None)
+                continue
+            if input is not None:
+                # As in communicate(): a child that exits without reading its
+                # input is reported by its exit status, not by EPIPE here
+                try:
+                    proc.stdin.write(input.encode())
+                except BrokenPipeError:
+                    pass
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+            procs.append(proc)
+
+        return [proc.wait() if proc else -1 for proc in procs]
+
+    def _iter_net_devices(self) -> Iterator[Tuple[str, str, str]]:
         try:
-            result = self._run_cmd(["nmcli", "-t", "-f", "ACTIVE,SSID", "dev", "wifi"])
-            for line in result.stdout.splitlines():
-                if line.startswith("yes:"):
-                    ssid = line.split(":", 1)[1]
-                    return ssid if ssid else None
-        except Exception:
-            pass
-        return None
+            names = sorted(os.listdir(SYSFS_NET))
+        except OSError:
+            return
+
+        for name in names:
+            base = f"{SYSFS_NET}/{name}"
+            if os.path.isdir(f"{base}/phy80211") or os.path.isdir(f"{base}/wireless"):
+                kind = "wifi"
+            elif os.path.exists(f"{base}/device/driver"):
+                kind = "ethernet"
+            else:
+                kind = "other"
 
-    def get_connected_wifi_interface(self) -> Optional[str]:
-        try:
-            result = self._run_cmd(
-                ["nmcli", "-t", "-f", "DEVICE,TYPE,STATE", "device", "status"]
+            try:
+                with open(f"{base}/operstate") as f:
+                    operstate = f.read().strip()
+                with open(f"{base}/carrier") as f:
+                    carrier = f.read().strip()
+            except OSError:
+                # carrier can't be read while the link is administratively down
+                operstate = carrier = ""
+
+            state = (
+                "connected" if operstate == "up" and carrier == "1" else "disconnected"
             )
-            for line in result.stdout.splitlines():
-                parts = line.split(":")
-                if len(parts) >= 3:
-                    device, dev_type, state = parts[0], parts[1], parts[2]
-                    if dev_type == "wifi" and state == "connected":
-                        return device
-        except Exception:
-            pass
-        return None
+            yield name, kind, state
+
+    def _connected_interfaces(self) -> Tuple[Optional[str], Optional[str]]:
+        own_ap = {self._virtual_interface}
+        if self._method_used == "hostapd" and self.current_config:
+            own_ap.add(self.current_config.interface)
+
+        wifi = ethernet = None
+        for name, kind, state in self._iter_net_devices():
+            if state != "connected" or name in own_ap:
+                continue
+            if kind == "wifi" and wifi is None:
+                wifi = name
+            elif kind == "ethernet" and ethernet is None:
+                ethernet = name
+        return wifi, ethernet
+
+    def get_connected_wifi_ssid(
+        self, wifi_interface: Optional[str] = None
+    ) -> Optional[str]:
+        if wifi_interface is None:
+            wifi_interface = self.get_connected_wifi_interface()
+            if wifi_interface is None:
+                return None
+        device = self._nm.get_device(wifi_interface)
+        return self._nm.get_active_ssid(device) if device else None
 
-    def get_internet_interface(self) -> Optional[str]:
-        wifi_iface = self.get_connected_wifi_interface()
-        if wifi_iface:
-            return wifi_iface
+    def get_connected_wifi_interface(self) -> Optional[str]:
+        return self._connected_interfaces()[0]
 
-        try:
-            result = self._run_cmd(
-                ["nmcli", "-t", "-f", "DEVICE,TYPE,STATE", "device", "status"]
-            )
-            for line in result.stdout.splitlines():
-                parts = line.split(":")
-                if len(parts) >= 3:
-                    device, dev_type, state = parts[0], parts[1], parts[2]
-                    if dev_type == "ethernet" and state == "connected":
-                        return device
-        except Exception:
-            pass
-        return None
+    def _get_connected_ethernet_interface(self) -> Optional[str]:
+        return self._connected_interfaces()[1]
+
+    def get_internet_interface(self) -> Optional[str]:
+        wifi_interface, ethernet_interface = self._connected_interfaces()
+        return wifi_interface or ethernet_interface
 
     def get_interface_ip(self, interface: str) -> Optional[str]:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
-            result = self._run_cmd(["ip", "addr", "show", interface])
-            for line in result.stdout.splitlines():
-                if "inet " in line:
-                    return line.split()[1].split("/")[0]
-        except Exception:
-            pass
-        return None
+            packed = fcntl.ioctl(
+                sock.fileno(),
+                SIOCGIFADDR,
+                struct.pack("256s", interface.encode()[:15]),
+            )
+            return socket.inet_ntoa(packed[20:24])
+        except OSError:
+            return None
+        finally:
+            sock.close()
 
     def _get_phy_number(self, interface: str) -> Optional[int]:
-        try:
-            result = self._run_cmd(["iw", "dev", interface, "info"])
-            for line in result.stdout.splitlines():
-                if "wiphy" in line:
-                    return int(line.split()[-1])
-        except Exception:
-            pass
-        return None
-
-    def _interface_exists(self, name: str) -> bool:
-        return os.path.exists(f"/sys/class/net/{name}")
+        return _read_phy(interface)
 
     def _create_virtual_interface(self, phy: int, base_name: str) -> Optional[str]:
         vif_name = f"{base_name}ap"
 
-        if self._interface_exists(vif_name):
+        try:
+            existing = set(os.listdir(SYSFS_NET))
+        except OSError:
+            existing = set()
+
+        if vif_name in existing:
             self._delete_virtual_interface(vif_name)
 
         try:
             result = self._run_cmd(
-                ["iw", "phy", f"phy{phy}", "interface", "add", vif_name, "type", "__ap"]
+                [
+                    resolve_command("iw"),
+                    "phy",
+                    f"phy{phy}",
+                    "interface",
+                    "add",
+                    vif_name,
+                    "type",
+                    "__ap",
+                ]
             )
 
-            if result.returncode == 0 and self._interface_exists(vif_name):
+            if result.returncode == 0:
                 logger.info(f"Created virtual AP interface: {vif_name}")
                 return vif_name
 
             for suffix in ["0", "1", "2", "3"]:
                 vif_name = f"{base_name}{suffix}"
-                if not self._interface_exists(vif_name):
+                if vif_name not in existing:
                     result = self._run_cmd(
                         [
-                            "iw",
+                            resolve_command("iw"),
                             "phy",
                             f"phy{phy}",
                             "interface",
@@ -171,89 +324,125 @@ class ConcurrentHotspotManager:
 
     def _delete_virtual_interface(self, name: str):
         try:
-            self._run_cmd(["iw", "dev", name, "del"])
+            self._run_cmd([resolve_command("iw"), "dev", name, "del"], capture=False)
             logger.info(f"Deleted virtual interface: {name}")
         except Exception:
             pass
 
-    def _setup_ip_forwarding(self):
-        self._run_cmd(["sysctl", "-w", "net.ipv4.ip_forward=1"])
+    def _iptables_rules(
+        self, action: str, rules: Tuple[Tuple[str, str], ...] = IPTABLES_RULES
+    ) -> str:
+        return "".join(f"*{table}\n{action} {rule}\nCOMMIT\n" for table, rule in rules)
+
+    def _cleanup_ip_forwarding(self):
+        cmd = [resolve_command("iptables-restore"), "--noflush"]
+        try:
+            result = self._run_cmd(cmd, input=self._iptables_rules("-D"), capture=False)
+            if result.returncode == 0:
+                return
+            # iptables-restore is all-or-nothing: if one rule is already gone
+            # the batch fails, so delete the rest one at a time
+            for rule in IPTABLES_RULES:
+                self._run_cmd(
+                    cmd, input=self._iptables_rules("-D", (rule,)), capture=False
+                )
+        except Exception:
+            pass
+
+    def _interface_ip_batch(self, interface: str, gateway: str) -> str:
+        return (
+            f"addr flush dev {interface}\n"
+            f"addr add {gateway}/24 dev {interface}\n"
+            f"link set {interface} up\n"
+        )
 
-        rules = [
-            ["iptables", "-t", "nat", "-A", "POSTROUTING", "-j", "MASQUERADE"],
-            ["iptables", "-A", "FORWARD", "-j", "ACCEPT"],
-        ]
-        for rule in rules:
-            self._run_cmd(rule)
+    def _setup_networking(self, interface: str, gateway: str):
+        self._run_cmd(
+            [resolve_command("sysctl"), "-w", "net.ipv4.ip_forward=1"], capture=False
+        )
 
-        logger.info("IP forwarding enabled")
+        # NAT rules and interface addressing don't depend on each other
+        nat_status, addr_status = self._run_parallel(
+            [
+                (
+                    [resolve_command("iptables-restore"), "--noflush"],
+                    self._iptables_rules("-A"),
+                ),
+                (
+                    [resolve_command("ip"), "-force", "-batch", "-"],
+                    self._interface_ip_batch(interface, gateway),
+                ),
+            ]
+        )
 
-    def _cleanup_ip_forwarding(self):
-        rules = [
-            ["iptables", "-t", "nat", "-D", "POSTROUTING", "-j", "MASQUERADE"],
-            ["iptables", "-D", "FORWARD", "-j", "ACCEPT"],
-        ]
-        for rule in rules:
-            try:
-                self._run_cmd(rule)
-            except Exception:
-                pass
+        if nat_status == 0:
+            logger.info("IP forwarding enabled")
+        else:
+            logger.error(f"iptables-restore failed to add NAT rules ({nat_status})")
+        if addr_status == 0:
+            logger.info(f"Configured {interface} with IP {gateway}")
+        else:
+            logger.error(f"ip -batch failed to configure {interface} ({addr_status})")
+
+    def _write_config_file(self, config_path: str, content: str) -> str:
+        data = content.encode()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        try:
+            fd = os.open(config_path, os.O_RDONLY | os.O_CLOEXEC | os.O_NOFOLLOW)
+            with os.fdopen(fd, "rb") as f:
+                # Another instance may have rewritten the shared /tmp path
+                if hashlib.blake2b(f.read(), digest_size=16).digest() == digest:
+                    # The mode passed to os.open only applies to new files
+                    os.fchmod(f.fileno(), 0o600)
+                    return config_path
+        except OSError:
+            pass
 
-    def _setup_interface_ip(self, interface: str, gateway: str):
-        self._run_cmd(["ip", "addr", "flush", "dev", interface])
-        self._run_cmd(["ip", "addr", "add", f"{gateway}/24", "dev", interface])
-        self._run_cmd(["ip", "link", "set", interface, "up"])
-        logger.info(f"Configured {interface} with IP {gateway}")
+        fd = os.open(
+            config_path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC | os.O_NOFOLLOW,
+            0o600,
+        )
+        try:
+            os.fchmod(fd, 0o600)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
+        return config_path
 
     def _write_hostapd_config(self, config: HotspotConfig, interface: str) -> str:
         config_path = "/tmp/hotspot-hostapd.conf"
         hw_mode = "g" if config.band == "bg" else "a"
 
-        content = f"""interface={interface}
-driver=nl80211
-ssid={config.ssid}
-hw_mode={hw_mode}
-channel={config.channel}
-ieee80211n=1
-wmm_enabled=1
-ht_capab=[HT40+][SHORT-GI-40]
-auth_algs=1
-wpa=2
-wpa_key_mgmt=WPA-PSK
-rsn_pairwise=CCMP
-wpa_passphrase={config.password}
-"""
-
-        with open(config_path, "w") as f:
-            f.write(content)
+        content = _HOSTAPD_TMPL.format_map(
+            {
+                **asdict(config),
+                "interface": interface,
+                "hw_mode": hw_mode,
+                "ctrl_interface": HOSTAPD_CTRL_DIR,
+            }
+        )
 
-        return config_path
+        return self._write_config_file(config_path, content)
 
     def _write_dnsmasq_config(self, config: HotspotConfig, interface: str) -> str:
         config_path = "/tmp/hotspot-dnsmasq.conf"
 
-        content = f"""interface={interface}
-bind-interfaces
-dhcp-range={config.ip_range_start},{config.ip_range_end},12h
-dhcp-option=3,{config.gateway}
-dhcp-option=6,8.8.8.8,8.8.4.4
-domain=local
-"""
-
-        with open(config_path, "w") as f:
-            f.write(content)
+        content = _DNSMASQ_TMPL.format_map({**asdict(config), "interface": interface})
 
-        return config_path
+        return self._write_config_file(config_path, content)
 
     def _start_hostapd(self, config_path: str) -> bool:
         try:
             self._hostapd_process = subprocess.Popen(
-                ["hostapd", "-B", config_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                [resolve_command("hostapd"), config_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
-            time.sleep(2)
-            return self._hostapd_process.poll() is None
+            return True
         except Exception as e:
             logger.error(f"Failed to start hostapd: {e}")
             return False
@@ -261,39 +450,96 @@ domain=local
     def _start_dnsmasq(self, config_path: str) -> bool:
         try:
             self._dnsmasq_process = subprocess.Popen(
-                ["dnsmasq", "-C", config_path, "--no-daemon"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                [
+                    resolve_command("dnsmasq"),
+                    "-C",
+                    config_path,
+                    "--keep-in-foreground",
+                    f"--pid-file={DNSMASQ_PID_FILE}",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
-            time.sleep(1)
             return True
         except Exception as e:
             logger.error(f"Failed to start dnsmasq: {e}")
             return False
 
-    def _stop_hostapd(self):
-        if self._hostapd_process:
+    def _wait_for_path(
+        self,
+        process: subprocess.Popen,
+        path: str,
+        started: float,
+        timeout: float = 10.0,
+    ) -> bool:
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                return False
             try:
-                self._hostapd_process.terminate()
-                self._hostapd_process.wait(timeout=5)
-            except Exception:
-                self._hostapd_process.kill()
-            self._hostapd_process = None
+                # Ignore a stale file left behind by an earlier instance
+                if os.stat(path).st_ctime >= started:
+                    return True
+            except OSError:
+                pass
+            time.sleep(0.025)
 
-        self._run_cmd(["pkill", "-f", "hostapd.*hotspot"])
+        return False
 
-    def _stop_dnsmasq(self):
-        if self._dnsmasq_process:
+    def _start_services(
+        self, hostapd_conf: str, dnsmasq_conf: str, interface: str
+    ) -> Optional[str]:
+        started = time.time() - 1
+
+        if not self._start_hostapd(hostapd_conf):
+            return "Failed to start hostapd"
+
+        if not self._start_dnsmasq(dnsmasq_conf):
+            self._stop_hostapd()
+            return "Failed to start dnsmasq"
+
+        ctrl_path = os.path.join(HOSTAPD_CTRL_DIR, interface)
+        if not self._wait_for_path(self._hostapd_process, ctrl_path, started):
+            self._stop_dnsmasq()
+            self._stop_hostapd()
+            return "Failed to start hostapd"
+
+        if not self._wait_for_path(
+            self._dnsmasq_process, DNSMASQ_PID_FILE, started
+        ):
+            self._stop_dnsmasq()
+            self._stop_hostapd()
+            return "Failed to start dnsmasq"
+
+        return None
+
+    def _stop_process(self, process: Optional[subprocess.Popen], comm: str):
+        if process:
             try:
-                self._dnsmasq_process.terminate()
-                self._dnsmasq_process.wait(timeout=5)
+                process.terminate()
+                process.wait(timeout=5)
             except Exception:
-                self._dnsmasq_process.kill()
-            self._dnsmasq_process = None
+                process.kill()
+            return
 
-        self._run_cmd(["pkill", "-f", "dnsmasq.*hotspot"])
+        # Last resort when we hold no handle: find it by name
+        for pid in _find_pids(comm, b"hotspot"):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _stop_hostapd(self):
+        self._stop_process(self._hostapd_process, "hostapd")
+        self._hostapd_process = None
+
+    def _stop_dnsmasq(self):
+        self._stop_process(self._dnsmasq_process, "dnsmasq")
+        self._dnsmasq_process = None
 
     def start_hotspot(self, config: HotspotConfig) -> Tuple[bool, str]:
+        self._gateway_prefix = config.gateway.rsplit(".", 1)[0] + "."
         internet_iface = config.internet_interface or self.get_internet_interface()
 
         if not internet_iface:
@@ -303,8 +549,9 @@ domain=local
             )
 
         hotspot_iface = config.interface
+        self._internet_interface = internet_iface
 
-        is_wifi_internet = "wl" in internet_iface or "wlan" in internet_iface
+        is_wifi_internet = internet_iface.startswith("wl")
         is_same_interface = internet_iface == hotspot_iface
 
         if is_wifi_internet and is_same_interface:
@@ -334,20 +581,15 @@ domain=local
 
         self._virtual_interface = vif
 
-        self._setup_ip_forwarding()
-        self._setup_interface_ip(vif, config.gateway)
+        self._setup_networking(vif, config.gateway)
 
         hostapd_conf = self._write_hostapd_config(config, vif)
         dnsmasq_conf = self._write_dnsmasq_config(config, vif)
 
-        if not self._start_hostapd(hostapd_conf):
-            self._cleanup_virtual_interface()
-            return False, "Failed to start hostapd"
-
-        if not self._start_dnsmasq(dnsmasq_conf):
-            self._stop_hostapd()
+        error = self._start_services(hostapd_conf, dnsmasq_conf, vif)
+        if error:
             self._cleanup_virtual_interface()
-            return False, "Failed to start dnsmasq"
+            return False, error
 
         self.hotspot_active = True
         self.current_config = config
@@ -363,20 +605,15 @@ domain=local
     def _start_with_hostapd(
         self, config: HotspotConfig, hotspot_iface: str, internet_iface: str
     ) -> Tuple[bool, str]:
-        self._setup_ip_forwarding()
-        self._setup_interface_ip(hotspot_iface, config.gateway)
+        self._setup_networking(hotspot_iface, config.gateway)
 
         hostapd_conf = self._write_hostapd_config(config, hotspot_iface)
         dnsmasq_conf = self._write_dnsmasq_config(config, hotspot_iface)
 
-        if not self._start_hostapd(hostapd_conf):
+        error = self._start_services(hostapd_conf, dnsmasq_conf, hotspot_iface)
+        if error:
             self._cleanup_ip_forwarding()
-            return False, "Failed to start hostapd"
-
-        if not self._start_dnsmasq(dnsmasq_conf):
-            self._stop_hostapd()
-            self._cleanup_ip_forwarding()
-            return False, "Failed to start dnsmasq"
+            return False, error
 
         self.hotspot_active = True
         self.current_config = config
@@ -404,14 +641,14 @@ domain=local
 
         if self.current_config:
             try:
-                subprocess.run(
+                self._run_cmd(
                     [
-                        "nmcli",
+                        resolve_command("nmcli"),
                         "connection",
                         "delete",
                         f"Hotspot-{self.current_config.ssid}",
                     ],
-                    capture_output=True,
+                    capture=False,
                 )
             except Exception:
                 pass
@@ -419,72 +656,189 @@ domain=local
         self.hotspot_active = False
         self.current_config = None
         self._method_used = None
+        self._internet_interface = None
         self._notify_callbacks("hotspot_stopped", {})
 
         return True, "Hotspot stopped successfully"
 
     def _start_monitoring(self):
-        self._stop_monitor.set()
-        time.sleep(0.5)
-        self._stop_monitor.clear()
-        self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self._monitor_thread.start()
+        self._stop_monitoring()
+
+        if self._hostapd_process:
+            self._hostapd_watch_id = GLib.child_watch_add(
+                GLib.PRIORITY_DEFAULT, self._hostapd_process.pid, self._on_hostapd_exit
+            )
+            self._attach_hostapd_ctrl(
+                self._virtual_interface or self.current_config.interface
+            )
+
+        if self._dnsmasq_process:
+            self._dnsmasq_watch_id = GLib.child_watch_add(
+                GLib.PRIORITY_DEFAULT, self._dnsmasq_process.pid, self._on_dnsmasq_exit
+            )
+
+        device = self._nm.get_device(self._internet_interface or "")
+        if device and (device.is_wifi or device.is_ethernet):
+            lost_event = "wifi_lost" if device.is_wifi else "ethernet_lost"
+            self._nm_subscription_id = self._nm.subscribe_device_state(
+                device,
+                lambda new, old: self._on_uplink_state_changed(lost_event, new, old),
+            )
 
     def _stop_monitoring(self):
-        self._stop_monitor.set()
-        if self._monitor_thread:
-            self._monitor_thread.join(timeout=2)
-
-    def _monitor_loop(self):
-        while not self._stop_monitor.is_set():
-            if self.hotspot_active:
-                if self._hostapd_process and self._hostapd_process.poll() is not None:
-                    logger.warning("hostapd process died!")
-                    self._notify_callbacks("hotspot_lost", {})
-                    break
-            self._stop_monitor.wait(5)
-
-    def get_connected_clients(self) -> List[Dict]:
-        clients = []
-        if not self.hotspot_active or not self.current_config:
-            return clients
+        if self._hostapd_watch_id:
+            GLib.source_remove(self._hostapd_watch_id)
+            self._hostapd_watch_id = None
+        if self._dnsmasq_watch_id:
+            GLib.source_remove(self._dnsmasq_watch_id)
+            self._dnsmasq_watch_id = None
+        if self._nm_subscription_id:
+            self._nm.unsubscribe(self._nm_subscription_id)
+            self._nm_subscription_id = None
+        self._detach_hostapd_ctrl()
+
+    def _attach_hostapd_ctrl(self, interface: str):
+        ctrl_path = os.path.join(HOSTAPD_CTRL_DIR, interface)
+        local_path = f"/tmp/hotspot-manager-ctrl-{os.getpid()}-{id(self):x}"
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            if os.path.exists(local_path):
+                os.unlink(local_path)
+            sock.bind(local_path)
+            sock.connect(ctrl_path)
+            sock.settimeout(2)
+            sock.send(b"ATTACH")
+            if sock.recv(64).strip() != b"OK":
+                raise OSError("ATTACH rejected")
+            sock.setblocking(False)
+        except OSError as e:
+            logger.warning(f"Could not attach to hostapd control socket: {e}")
+            sock.close()
+            if os.path.exists(local_path):
+                os.unlink(local_path)
+            return
+
+        self._hostapd_ctrl = sock
+        self._hostapd_ctrl_path = local_path
+        self._hostapd_ctrl_watch_id = GLib.io_add_watch(
+            sock.fileno(),
+            GLib.PRIORITY_DEFAULT,
+            GLib.IOCondition.IN,
+            self._on_hostapd_ctrl_event,
+        )
 
+    def _detach_hostapd_ctrl(self):
+        if self._hostapd_ctrl_watch_id:
+            GLib.source_remove(self._hostapd_ctrl_watch_id)
+            self._hostapd_ctrl_watch_id = None
+        if self._hostapd_ctrl:
+            try:
+                self._hostapd_ctrl.send(b"DETACH")
+            except OSError:
+                pass
+            self._hostapd_ctrl.close()
+            self._hostapd_ctrl = None
+        if self._hostapd_ctrl_path:
+            try:
+                os.unlink(self._hostapd_ctrl_path)
+            except OSError:
+                pass
+            self._hostapd_ctrl_path = None
+
+    def _on_hostapd_ctrl_event(self, fd: int, condition) -> bool:
         try:
-            result = self._run_cmd(["arp", "-a"])
-            gateway = self.current_config.gateway
-            gateway_prefix = ".".join(gateway.split(".")[:3])
-
-            for line in result.stdout.splitlines():
-                if gateway not in line and "(" in line:
-                    match = re.search(r"\((\d+\.\d+\.\d+\.\d+)\)", line)
-                    if match:
-                        ip = match.group(1)
-                        if ip.startswith(gateway_prefix):
-                            hostname = line.split()[0] if line.split() else "unknown"
-                            clients.append({"ip": ip, "hostname": hostname})
-        except Exception:
-            pass
+            message = self._hostapd_ctrl.recv(4096).decode("utf-8", "replace")
+        except BlockingIOError:
+            return True
+        except (OSError, AttributeError):
+            self._hostapd_ctrl_watch_id = None
+            return False
+
+        # Unsolicited events look like "<3>AP-STA-CONNECTED aa:bb:cc:dd:ee:ff"
+        if message.startswith("<"):
+            message = message.partition(">")[2]
+        event, _, args = message.partition(" ")
+        mac = args.split(" ", 1)[0].strip()
+
+        if event == "AP-STA-CONNECTED":
+            self._notify_callbacks("sta_connected", {"mac": mac})
+        elif event == "AP-STA-DISCONNECTED":
+            self._notify_callbacks("sta_disconnected", {"mac": mac})
+
+        return True
+
+    def _on_hostapd_exit(self, pid: int, status: int):
+        self._hostapd_watch_id = None
+        if self.hotspot_active:
+            logger.warning("hostapd process died!")
+            self._notify_callbacks("hotspot_lost", {"process": "hostapd"})
+
+    def _on_dnsmasq_exit(self, pid: int, status: int):
+        self._dnsmasq_watch_id = None
+        if self.hotspot_active:
+            logger.warning("dnsmasq process died!")
+            self._notify_callbacks("hotspot_lost", {"process": "dnsmasq"})
+
+    def _on_uplink_state_changed(self, event: str, new_state: int, old_state: int):
+        if (
+            self.hotspot_active
+            and old_state == NM_DEVICE_STATE_ACTIVATED
+            and new_state != NM_DEVICE_STATE_ACTIVATED
+        ):
+            logger.warning(f"Internet connection on {self._internet_interface} lost")
+            self._notify_callbacks(event, {"interface": self._internet_interface})
+
+    def _lookup_hostname(self, ip: str) -> str:
+        try:
+            return socket.gethostbyaddr(ip)[0]
+        except OSError:
+            return "unknown"
 
-        return clients
+    def _iter_connected_clients(
+        self, resolve_hostnames: bool = False
+    ) -> Iterator[Dict]:
+        if not self.hotspot_active or not self.current_config:
+            return
 
-    def get_status(self) -> Dict:
-        wifi_ssid = self.get_connected_wifi_ssid()
-        wifi_interface = self.get_connected_wifi_interface()
-        ethernet_interface = None
+        interface = self._virtual_interface or self.current_config.interface
+        gateway = self.current_config.gateway
+        gateway_prefix = self._gateway_prefix
 
         try:
-            result = self._run_cmd(
-                ["nmcli", "-t", "-f", "DEVICE,TYPE,STATE", "device", "status"]
-            )
-            for line in result.stdout.splitlines():
-                parts = line.split(":")
-                if len(parts) >= 3:
-                    device, dev_type, state = parts[0], parts[1], parts[2]
-                    if dev_type == "ethernet" and state == "connected":
-                        ethernet_interface = device
-                        break
-        except Exception:
-            pass
+            with open("/proc/net/arp") as f:
+                next(f, None)
+                for line in f:
+                    fields = line.split()
+                    if len(fields) < 6:
+                        continue
+                    ip, _hw_type, flags, mac, _mask, device = fields[:6]
+                    if (
+                        device != interface
+                        or flags == "0x0"
+                        or ip == gateway
+                        or not ip.startswith(gateway_prefix)
+                    ):
+                        continue
+                    hostname = (
+                        self._lookup_hostname(ip) if resolve_hostnames else "unknown"
+                    )
+                    yield {"ip": ip, "mac": mac, "hostname": hostname}
+        except OSError as e:
+            logger.debug(f"Could not read ARP table: {e}")
+
+    def get_connected_clients(self, resolve_hostnames: bool = False) -> List[Dict]:
+        return list(self._iter_connected_clients(resolve_hostnames))
+
+    def get_status(self, clients: Optional[List[Dict]] = None) -> Dict:
+        if clients is None:
+            client_count = sum(1 for _ in self._iter_connected_clients())
+        else:
+            client_count = len(clients)
+
+        wifi_interface, ethernet_interface = self._connected_interfaces()
+        wifi_ssid = (
+            self.get_connected_wifi_ssid(wifi_interface) if wifi_interface else None
+        )
 
         return {
             "wifi_connected": wifi_ssid is not None,
@@ -496,27 +850,38 @@ domain=local
             "hotspot_active": self.hotspot_active,
             "hotspot_ssid": self.current_config.ssid if self.current_config else None,
             "hotspot_method": self._method_used,
-            "connected_clients": len(self.get_connected_clients()),
+            "connected_clients": client_count,
         }
 
+    def get_status_and_clients(
+        self, resolve_hostnames: bool = False
+    ) -> Tuple[Dict, List[Dict]]:
+        clients = self.get_connected_clients(resolve_hostnames)
+        return self.get_status(clients), clients
+
     def save_config(self, config: HotspotConfig, config_path: str = None):
         path = Path(
             config_path or os.path.expanduser("~/.config/hotspot-manager/config.json")
         )
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w") as f:
-            json.dump(
-                {
-                    "ssid": config.ssid,
-                    "password": config.password,
-                    "interface": config.interface,
-                    "channel": config.channel,
-                    "band": config.band,
-                    "internet_interface": config.internet_interface,
-                },
-                f,
-            )
+        data = {
+            "ssid": config.ssid,
+            "password": config.password,
+            "interface": config.interface,
+            "channel": config.channel,
+            "band": config.band,
+            "internet_interface": config.internet_interface,
+        }
+        if orjson:
+            payload = orjson.dumps(data)
+        else:
+            payload = json.dumps(data, separators=(",", ":")).encode()
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
 
         logger.info(f"Config saved to {path}")
 
@@ -529,8 +894,8 @@ domain=local
             return None
 
         try:
-            with open(path) as f:
-                data = json.load(f)
+            raw = path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
 
             return HotspotConfig(
                 ssid=data.get("ssid", "MyHotspot"),
@@ -4,30 +4,49 @@ import gi
 gi.require_version("Gtk", "3.0")
 gi.require_version("AppIndicator3", "0.1")
 
-from gi.repository import Gtk, GLib, Gdk, Pango
+from gi.repository import Gtk, GLib, Gio, Gdk, Pango
 from gi.repository import AppIndicator3
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Tuple
 import threading
+import queue
 import logging
 import os
 from pathlib import Path
 
 from .hardware_detector import HardwareDetector, WifiInterface
 from .hotspot_manager import ConcurrentHotspotManager, HotspotConfig
+from .nm_client import NetworkManagerClient
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
 class HotspotManagerApp:
+    ICON_SIZE = Gtk.IconSize.MENU
+    ICON_WIFI_ON = "network-wireless-connected"
+    ICON_WIFI_OFF = "network-wireless-disconnected"
+    ICON_WIRED_ON = "network-wired"
+    ICON_WIRED_OFF = "network-wired-disconnected"
+    ICON_HOTSPOT = "network-wireless-hotspot"
+    ICON_OK = "emblem-ok"
+    ICON_INFO = "dialog-information"
+    ICON_WARNING = "dialog-warning"
+    ICON_CLIENT = "computer"
+    ICON_TRAY_ACTIVE = "network-wireless-hotspot-symbolic"
+    ICON_TRAY_IDLE = "network-wireless-symbolic"
+
+    # (key, initial icon, initial text) for each row of the status section
+    STATUS_ROWS = [
+        ("wifi", "network-wireless", "WiFi: Checking..."),
+        ("ethernet", ICON_WIRED_ON, "Ethernet: Checking..."),
+        ("hotspot", ICON_HOTSPOT, "Hotspot: Inactive"),
+        ("mode", ICON_OK, "Concurrent Mode: Waiting..."),
+    ]
+
     def __init__(self):
-        self.app = (
-            Gtk.Application(
-                application_id="com.hotspot.manager",
-                flags=Gio.ApplicationFlags.FLAGS_NONE,
-            )
-            if self._check_gio()
-            else None
+        self.app = Gtk.Application(
+            application_id="com.hotspot.manager",
+            flags=Gio.ApplicationFlags.FLAGS_NONE,
         )
 
         self.detector = HardwareDetector()
@@ -37,32 +56,52 @@ class HotspotManagerApp:
         self.window: Optional[Gtk.Window] = None
         self.indicator: Optional[AppIndicator3.Indicator] = None
         self.interfaces: list = []
-        self.status_timeout_id = None
-        self.clients_timeout_id = None
+        self._interfaces_stale = True
+        self._link_state_stale = False
+        self.refresh_timeout_id = None
+        self._refresh_interval: Optional[int] = None
+        self._refresh_in_flight = False
+        self._refresh_again = False
+        self._nm = NetworkManagerClient()
+        self._network_changed_id = None
+        self._nm_subscription_ids: List[int] = []
+        self._pending_status_id = None
+        self._last_ui: Dict[str, object] = {}
+        self._client_rows: Dict[str, Tuple[Gtk.ListBoxRow, Gtk.Label]] = {}
+        self._notifier = None
+        self._error_dialog: Optional[Gtk.MessageDialog] = None
+        self._info_dialog: Optional[Gtk.MessageDialog] = None
+        self._config_cache: Optional[HotspotConfig] = None
+        self._work_queue: queue.Queue = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
 
         self._init_indicator()
-
-    def _check_gio(self):
-        try:
-            from gi.repository import Gio
-
-            return True
-        except ImportError:
-            return False
+        self._init_notifier()
 
     def _init_indicator(self):
         try:
             self.indicator = AppIndicator3.Indicator.new(
                 "hotspot-manager",
-                "network-wireless-symbolic",
+                self.ICON_TRAY_IDLE,
                 AppIndicator3.IndicatorCategory.APPLICATION_STATUS,
             )
             self.indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
-            self._update_indicator_menu()
+            self._build_indicator_menu()
         except Exception as e:
             logger.warning(f"Could not create system tray indicator: {e}")
 
-    def _update_indicator_menu(self):
+    def _init_notifier(self):
+        try:
+            import notify2
+
+            notify2.init("Hotspot Manager")
+            self._notifier = notify2.Notification("", "", "network-wireless")
+        except ImportError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not set up desktop notifications: {e}")
+
+    def _build_indicator_menu(self):
         if not self.indicator:
             return
 
@@ -91,19 +130,31 @@ class HotspotManagerApp:
         menu.show_all()
         self.indicator.set_menu(menu)
 
+    def _worker_loop(self):
+        # Start/stop run one at a time, in the order they were requested
+        while True:
+            func, args = self._work_queue.get()
+            try:
+                func(*args)
+            except Exception as e:
+                logger.error(f"Background task failed: {e}")
+
+    def _run_in_background(self, func, *args):
+        self._work_queue.put((func, args))
+
     def _on_toggle_from_tray(self, widget):
+        self._run_in_background(self._toggle_hotspot_async, self._get_config())
+
+    def _toggle_hotspot_async(self, config: Optional[HotspotConfig]):
+        # Decide when the job runs, so quick repeated toggles alternate
         if self.manager.hotspot_active:
-            threading.Thread(target=self._stop_hotspot_async, daemon=True).start()
-        else:
-            config = self.manager.load_config()
-            if config:
-                threading.Thread(
-                    target=self._start_hotspot_async, args=(config,), daemon=True
-                ).start()
+            self._stop_hotspot_async()
+        elif config:
+            self._start_hotspot_async(config)
 
     def _start_hotspot_async(self, config: HotspotConfig):
         success, message = self.manager.start_hotspot(config)
-        GLib.idle_add(self._update_status_display)
+        GLib.idle_add(self._schedule_status_update)
         if success:
             GLib.idle_add(lambda: self._show_info(message))
         else:
@@ -111,10 +162,10 @@ class HotspotManagerApp:
 
     def _stop_hotspot_async(self):
         self.manager.stop_hotspot()
-        GLib.idle_add(self._update_status_display)
+        GLib.idle_add(self._schedule_status_update)
 
     def _on_hotspot_event(self, event: str, data: dict):
-        GLib.idle_add(self._update_status_display)
+        GLib.idle_add(self._schedule_status_update)
 
         if event == "hotspot_started":
             self._show_notification(
@@ -122,22 +173,38 @@ class HotspotManagerApp:
             )
         elif event == "hotspot_stopped":
             self._show_notification("Hotspot Stopped", "The hotspot has been stopped")
-        elif event == "wifi_lost":
+        elif event in ("wifi_lost", "ethernet_lost"):
+            kind = "WiFi" if event == "wifi_lost" else "Ethernet"
             self._show_notification(
-                "WiFi Lost", "WiFi connection was lost, hotspot stopped"
+                f"{kind} Lost",
+                f"{kind} connection on {data.get('interface')} was lost; "
+                "the hotspot stays up but has no internet access",
             )
 
+    def _schedule_status_update(self):
+        # Collapse bursts of events into a single refresh
+        if self._pending_status_id:
+            return
+        self._pending_status_id = GLib.timeout_add(200, self._flush_status_update)
+
+    def _flush_status_update(self) -> bool:
+        self._pending_status_id = None
+        self._refresh_all()
+        return False
+
     def _show_notification(self, title: str, message: str):
+        if not self._notifier:
+            return
         try:
-            import notify2
+            self._notifier.update(title, message, "network-wireless")
+            self._notifier.show()
+        except Exception as e:
+            logger.warning(f"Could not show notification: {e}")
 
-            notify2.init("Hotspot Manager")
-            notification = notify2.Notification(title, message, "network-wireless")
-            notification.show()
-        except ImportError:
-            pass
+    def _ensure_window_built(self):
+        if self.window:
+            return
 
-    def build_ui(self):
         self.window = Gtk.Window()
         self.window.set_title("Concurrent Hotspot Manager")
         self.window.set_default_size(600, 500)
@@ -155,26 +222,45 @@ class HotspotManagerApp:
         self._create_clients_section(main_box)
         self._create_action_buttons(main_box)
 
-        self._refresh_interfaces()
-
-        self.window.show_all()
-
-        self.status_timeout_id = GLib.timeout_add(2000, self._update_status_display)
-        self.clients_timeout_id = GLib.timeout_add(5000, self._update_clients_list)
-
-        config = self.manager.load_config()
+        config = self._get_config()
         if config:
             self.ssid_entry.set_text(config.ssid)
             self.password_entry.set_text(config.password)
             self.channel_spin.set_value(config.channel)
 
+    def _watch_network_changes(self):
+        self._network_changed_id = Gio.NetworkMonitor.get_default().connect(
+            "network-changed", self._on_network_changed
+        )
+        subscriptions = [
+            self._nm.subscribe_properties_changed(self._on_nm_properties_changed),
+            self._nm.subscribe_manager_signal(
+                "DeviceAdded", self._on_nm_devices_changed
+            ),
+            self._nm.subscribe_manager_signal(
+                "DeviceRemoved", self._on_nm_devices_changed
+            ),
+        ]
+        self._nm_subscription_ids = [sid for sid in subscriptions if sid]
+
+    def _on_network_changed(self, monitor, available: bool):
+        self._link_state_stale = True
+        self._schedule_status_update()
+
+    def _on_nm_properties_changed(self, changed: Dict):
+        if "ActiveConnections" in changed or "State" in changed:
+            self._link_state_stale = True
+            self._schedule_status_update()
+
+    def _on_nm_devices_changed(self, params: tuple):
+        self._interfaces_stale = True
+        self._schedule_status_update()
+
     def _create_header(self) -> Gtk.Widget:
         header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         header_box.set_margin_bottom(10)
 
-        icon = Gtk.Image.new_from_icon_name(
-            "network-wireless-hotspot", Gtk.IconSize.DIALOG
-        )
+        icon = Gtk.Image.new_from_icon_name(self.ICON_HOTSPOT, Gtk.IconSize.DIALOG)
         header_box.pack_start(icon, False, False, 0)
 
         title_label = Gtk.Label()
@@ -201,39 +287,17 @@ class HotspotManagerApp:
         status_box.set_margin_end(10)
         frame.add(status_box)
 
-        wifi_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-        self.wifi_icon = Gtk.Image.new_from_icon_name(
-            "network-wireless", Gtk.IconSize.MENU
-        )
-        wifi_row.pack_start(self.wifi_icon, False, False, 0)
-        self.wifi_status_label = Gtk.Label(label="WiFi: Checking...")
-        wifi_row.pack_start(self.wifi_status_label, False, False, 0)
-        status_box.pack_start(wifi_row, False, False, 0)
-
-        ethernet_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-        self.ethernet_icon = Gtk.Image.new_from_icon_name(
-            "network-wired", Gtk.IconSize.MENU
-        )
-        ethernet_row.pack_start(self.ethernet_icon, False, False, 0)
-        self.ethernet_status_label = Gtk.Label(label="Ethernet: Checking...")
-        ethernet_row.pack_start(self.ethernet_status_label, False, False, 0)
-        status_box.pack_start(ethernet_row, False, False, 0)
-
-        hotspot_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-        self.hotspot_icon = Gtk.Image.new_from_icon_name(
-            "network-wireless-hotspot", Gtk.IconSize.MENU
-        )
-        hotspot_row.pack_start(self.hotspot_icon, False, False, 0)
-        self.hotspot_status_label = Gtk.Label(label="Hotspot: Inactive")
-        hotspot_row.pack_start(self.hotspot_status_label, False, False, 0)
-        status_box.pack_start(hotspot_row, False, False, 0)
-
-        mode_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
-        self.mode_icon = Gtk.Image.new_from_icon_name("emblem-ok", Gtk.IconSize.MENU)
-        mode_row.pack_start(self.mode_icon, False, False, 0)
-        self.mode_status_label = Gtk.Label(label="Concurrent Mode: Waiting...")
-        mode_row.pack_start(self.mode_status_label, False, False, 0)
-        status_box.pack_start(mode_row, False, False, 0)
+        self.status_icons: Dict[str, Gtk.Image] = {}
+        self.status_labels: Dict[str, Gtk.Label] = {}
+        for key, icon_name, text in self.STATUS_ROWS:
+            row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+            icon = Gtk.Image.new_from_icon_name(icon_name, self.ICON_SIZE)
+            row.pack_start(icon, False, False, 0)
+            label = Gtk.Label(label=text)
+            row.pack_start(label, False, False, 0)
+            status_box.pack_start(row, False, False, 0)
+            self.status_icons[key] = icon
+            self.status_labels[key] = label
 
     def _create_config_section(self, parent: Gtk.Box):
         frame = Gtk.Frame(label="Hotspot Configuration")
@@ -342,9 +406,8 @@ class HotspotManagerApp:
         save_button.connect("clicked", self._on_save_config)
         button_box.pack_start(save_button, False, False, 0)
 
-    def _refresh_interfaces(self):
-        self.interfaces = self.detector.get_wifi_interfaces()
-
+    def _populate_interface_combo(self):
+        selected = self.interface_combo.get_active_id()
         self.interface_combo.remove_all()
 
         for iface in self.interfaces:
@@ -361,7 +424,9 @@ class HotspotManagerApp:
             if iface.connected:
                 self.interface_combo.set_active_id(iface.name)
 
-        if self.interface_combo.get_active_id() is None and self.interfaces:
+        if selected and any(iface.name == selected for iface in self.interfaces):
+            self.interface_combo.set_active_id(selected)
+        elif self.interface_combo.get_active_id() is None and self.interfaces:
             self.interface_combo.set_active(0)
 
     def _on_show_password_toggled(self, widget):
@@ -394,16 +459,19 @@ class HotspotManagerApp:
             band=band,
         )
 
-        self.start_button.set_sensitive(False)
-        self.start_button.set_label("Starting...")
+        self._set_sensitive("start_sensitive", self.start_button, False)
+        self._set_label("start_label", self.start_button, "Starting...")
 
-        threading.Thread(
-            target=self._start_hotspot_async, args=(config,), daemon=True
-        ).start()
+        self._run_in_background(self._start_hotspot_async, config)
 
     def _on_stop_clicked(self, widget):
-        self.stop_button.set_sensitive(False)
-        threading.Thread(target=self._stop_hotspot_async, daemon=True).start()
+        self._set_sensitive("stop_sensitive", self.stop_button, False)
+        self._run_in_background(self._stop_hotspot_async)
+
+    def _get_config(self) -> Optional[HotspotConfig]:
+        if self._config_cache is None:
+            self._config_cache = self.manager.load_config()
+        return self._config_cache
 
     def _on_save_config(self, widget):
         config = HotspotConfig(
@@ -414,163 +482,306 @@ class HotspotManagerApp:
             band=self.band_combo.get_active_id() or "bg",
         )
         self.manager.save_config(config)
+        self._config_cache = config
         self._show_info("Configuration saved!")
 
-    def _update_status_display(self) -> bool:
-        if not self.window:
-            return False
+    def _set_label(self, key: str, widget, text: str):
+        if self._last_ui.get(key) != text:
+            self._last_ui[key] = text
+            widget.set_label(text)
+
+    def _set_icon(self, key: str, widget: Gtk.Image, icon_name: str):
+        if self._last_ui.get(key) != icon_name:
+            self._last_ui[key] = icon_name
+            widget.set_from_icon_name(icon_name, self.ICON_SIZE)
+
+    def _set_sensitive(self, key: str, widget: Gtk.Widget, sensitive: bool):
+        if self._last_ui.get(key) != sensitive:
+            self._last_ui[key] = sensitive
+            widget.set_sensitive(sensitive)
+
+    def _set_tray_icon(self, icon_name: str):
+        if self._last_ui.get("tray_icon") != icon_name:
+            self._last_ui["tray_icon"] = icon_name
+            self.indicator.set_icon(icon_name)
+
+    def _refresh_all(self) -> bool:
+        # Nothing but the tray is on screen, and it only needs the active flag
+        if not (self.window and self.window.get_mapped()):
+            self._update_tray_status(self.manager.hotspot_active)
+            return True
 
-        status = self.manager.get_status()
+        # Fetching blocks on I/O, so do it off the main loop and only render here
+        if self._refresh_in_flight:
+            self._refresh_again = True
+            return True
+        self._refresh_in_flight = True
 
-        has_internet = status.get("wifi_connected") or status.get("ethernet_connected")
+        # None skips the interface probe; False rereads only link state, as
+        # hardware is rescanned just on DeviceAdded/DeviceRemoved
+        refresh_hw = None
+        if self._interfaces_stale or self._link_state_stale:
+            refresh_hw = self._interfaces_stale
+            self._interfaces_stale = self._link_state_stale = False
 
+        with_clients = self.manager.hotspot_active
+        threading.Thread(
+            target=self._fetch_refresh, args=(with_clients, refresh_hw), daemon=True
+        ).start()
+        return True
+
+    def _fetch_refresh(self, with_clients: bool, refresh_hw: Optional[bool]):
+        interfaces = None
+        if refresh_hw is not None:
+            try:
+                interfaces = self.detector.get_wifi_interfaces(refresh_hw=refresh_hw)
+            except Exception as e:
+                logger.error(f"Interface refresh failed: {e}")
+
+        status, clients = None, []
+        try:
+            if with_clients:
+                status, clients = self.manager.get_status_and_clients(
+                    resolve_hostnames=True
+                )
+            else:
+                status = self.manager.get_status()
+        except Exception as e:
+            logger.error(f"Status refresh failed: {e}")
+        GLib.idle_add(
+            self._apply_refresh, status, clients, with_clients, refresh_hw, interfaces
+        )
+
+    def _apply_refresh(
+        self,
+        status: Optional[Dict],
+        clients: List[Dict],
+        with_clients: bool,
+        refresh_hw: Optional[bool],
+        interfaces: Optional[List[WifiInterface]],
+    ) -> bool:
+        self._refresh_in_flight = False
+
+        if interfaces is not None:
+            self.interfaces = list(interfaces)
+            self._populate_interface_combo()
+        elif refresh_hw is not None:
+            # The probe failed; try again on the next refresh
+            self._interfaces_stale = self._interfaces_stale or refresh_hw
+            self._link_state_stale = True
+
+        if status is not None:
+            self._update_tray_status(status["hotspot_active"])
+        if status is not None and self.window.get_mapped():
+            self._update_status_display(status)
+            if with_clients or not status["hotspot_active"]:
+                self._update_clients_list(clients)
+        if self._window_visible():
+            self._sync_refresh_timer(self.manager.hotspot_active)
+
+        if self._refresh_again:
+            self._refresh_again = False
+            self._refresh_all()
+        return False
+
+    def _window_visible(self) -> bool:
+        return bool(self.window and self.window.get_visible())
+
+    def _sync_refresh_timer(self, hotspot_active: bool):
+        # Clients need a short poll; otherwise signals drive updates and the
+        # timer only catches anything they miss
+        interval = 5 if hotspot_active else 30
+        if self.refresh_timeout_id and self._refresh_interval == interval:
+            return
+        if self.refresh_timeout_id:
+            GLib.source_remove(self.refresh_timeout_id)
+        self.refresh_timeout_id = GLib.timeout_add_seconds(interval, self._refresh_all)
+        self._refresh_interval = interval
+
+    def _compute_status_view(self, status: Dict) -> List[Tuple[str, str, str]]:
         if status["wifi_connected"]:
-            self.wifi_icon.set_from_icon_name(
-                "network-wireless-connected", Gtk.IconSize.MENU
-            )
-            self.wifi_status_label.set_text(f"WiFi: {status['wifi_ssid']}")
+            wifi = (self.ICON_WIFI_ON, f"WiFi: {status['wifi_ssid']}")
         else:
-            self.wifi_icon.set_from_icon_name(
-                "network-wireless-disconnected", Gtk.IconSize.MENU
-            )
-            self.wifi_status_label.set_text("WiFi: Not connected")
+            wifi = (self.ICON_WIFI_OFF, "WiFi: Not connected")
 
         if status.get("ethernet_connected"):
-            self.ethernet_icon.set_from_icon_name("network-wired", Gtk.IconSize.MENU)
-            self.ethernet_status_label.set_text(
-                f"Ethernet: {status['ethernet_interface']}"
-            )
+            ethernet = (self.ICON_WIRED_ON, f"Ethernet: {status['ethernet_interface']}")
         else:
-            self.ethernet_icon.set_from_icon_name(
-                "network-wired-disconnected", Gtk.IconSize.MENU
-            )
-            self.ethernet_status_label.set_text("Ethernet: Not connected")
+            ethernet = (self.ICON_WIRED_OFF, "Ethernet: Not connected")
 
         if status["hotspot_active"]:
-            self.hotspot_icon.set_from_icon_name(
-                "network-wireless-hotspot", Gtk.IconSize.MENU
-            )
-            self.hotspot_status_label.set_text(f"Hotspot: {status['hotspot_ssid']}")
-
-            self.mode_icon.set_from_icon_name("emblem-ok", Gtk.IconSize.MENU)
+            hotspot = (self.ICON_HOTSPOT, f"Hotspot: {status['hotspot_ssid']}")
             source = status.get("internet_interface", "unknown")
-            self.mode_status_label.set_text(f"Sharing internet from: {source}")
-
-            self.start_button.set_sensitive(False)
-            self.stop_button.set_sensitive(True)
-
-            if self.indicator:
-                self.indicator.set_icon("network-wireless-hotspot-symbolic")
-                self.status_menu_item.set_label("Status: Active")
+            mode = (self.ICON_OK, f"Sharing internet from: {source}")
         else:
-            self.hotspot_icon.set_from_icon_name(
-                "network-wireless-hotspot", Gtk.IconSize.MENU
-            )
-            self.hotspot_status_label.set_text("Hotspot: Inactive")
-
-            if has_internet:
-                self.mode_icon.set_from_icon_name(
-                    "dialog-information", Gtk.IconSize.MENU
-                )
+            hotspot = (self.ICON_HOTSPOT, "Hotspot: Inactive")
+            if status.get("wifi_connected"):
+                mode = (self.ICON_INFO, f"Ready to share WiFi: {status['wifi_ssid']}")
+            elif status.get("ethernet_connected"):
                 source = status.get("internet_interface", "")
-                if status.get("wifi_connected"):
-                    self.mode_status_label.set_text(
-                        f"Ready to share WiFi: {status['wifi_ssid']}"
-                    )
-                else:
-                    self.mode_status_label.set_text(
-                        f"Ready to share Ethernet: {source}"
-                    )
+                mode = (self.ICON_INFO, f"Ready to share Ethernet: {source}")
             else:
-                self.mode_icon.set_from_icon_name("dialog-warning", Gtk.IconSize.MENU)
-                self.mode_status_label.set_text("Connect to WiFi or Ethernet first")
+                mode = (self.ICON_WARNING, "Connect to WiFi or Ethernet first")
 
-            self.start_button.set_sensitive(has_internet)
-            self.start_button.set_label("Start Hotspot")
-            self.stop_button.set_sensitive(False)
+        return [
+            ("wifi", *wifi),
+            ("ethernet", *ethernet),
+            ("hotspot", *hotspot),
+            ("mode", *mode),
+        ]
 
-            if self.indicator:
-                self.indicator.set_icon("network-wireless-symbolic")
-                self.status_menu_item.set_label("Status: Inactive")
+    def _update_status_display(self, status: Dict):
+        for key, icon_name, text in self._compute_status_view(status):
+            self._set_icon(f"{key}_icon", self.status_icons[key], icon_name)
+            self._set_label(f"{key}_status", self.status_labels[key], text)
 
-        return True
-
-    def _update_clients_list(self) -> bool:
-        if not self.window:
-            return False
+        if status["hotspot_active"]:
+            self._set_sensitive("start_sensitive", self.start_button, False)
+            self._set_sensitive("stop_sensitive", self.stop_button, True)
+        else:
+            has_internet = bool(
+                status.get("wifi_connected") or status.get("ethernet_connected")
+            )
+            self._set_sensitive("start_sensitive", self.start_button, has_internet)
+            self._set_label("start_label", self.start_button, "Start Hotspot")
+            self._set_sensitive("stop_sensitive", self.stop_button, False)
 
-        for child in self.clients_list.get_children():
-            self.clients_list.remove(child)
+    def _set_tray_status_text(self, text: str):
+        self._set_label("tray_status", self.status_menu_item, text)
 
-        clients = self.manager.get_connected_clients()
+    def _update_tray_status(self, hotspot_active: bool):
+        if not self.indicator:
+            return
+        if hotspot_active:
+            self._set_tray_icon(self.ICON_TRAY_ACTIVE)
+            self._set_tray_status_text("Status: Active")
+        else:
+            self._set_tray_icon(self.ICON_TRAY_IDLE)
+            self._set_tray_status_text("Status: Inactive")
+
+    def _update_clients_list(self, clients: List[Dict]):
+        current = {client["mac"]: client for client in clients}
+
+        for mac in set(self._client_rows) - set(current):
+            row, _info = self._client_rows.pop(mac)
+            self.clients_list.remove(row)
+            row.destroy()
+
+        added = False
+        for mac, client in current.items():
+            text = f"{client['hostname']} - {client['ip']}"
+            if mac in self._client_rows:
+                _row, info = self._client_rows[mac]
+                if info.get_text() != text:
+                    info.set_text(text)
+                continue
 
-        for client in clients:
             row = Gtk.ListBoxRow()
             box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
 
-            icon = Gtk.Image.new_from_icon_name("computer", Gtk.IconSize.MENU)
+            icon = Gtk.Image.new_from_icon_name(self.ICON_CLIENT, self.ICON_SIZE)
             box.pack_start(icon, False, False, 0)
 
-            info = Gtk.Label(label=f"{client['hostname']} - {client['ip']}")
+            info = Gtk.Label(label=text)
             info.set_halign(Gtk.Align.START)
             box.pack_start(info, True, True, 0)
 
             row.add(box)
             self.clients_list.add(row)
+            self._client_rows[mac] = (row, info)
+            added = True
 
-        self.clients_list.show_all()
-
-        return True
+        if added:
+            self.clients_list.show_all()
 
     def _show_error(self, message: str):
-        dialog = Gtk.MessageDialog(
-            transient_for=self.window,
-            flags=0,
-            message_type=Gtk.MessageType.ERROR,
-            buttons=Gtk.ButtonsType.OK,
-            text="Error",
-        )
-        dialog.format_secondary_text(message)
-        dialog.run()
-        dialog.destroy()
+        if self._error_dialog is None:
+            self._error_dialog = Gtk.MessageDialog(
+                flags=0,
+                message_type=Gtk.MessageType.ERROR,
+                buttons=Gtk.ButtonsType.OK,
+                text="Error",
+            )
+        self._run_message_dialog(self._error_dialog, message)
 
     def _show_info(self, message: str):
-        dialog = Gtk.MessageDialog(
-            transient_for=self.window,
-            flags=0,
-            message_type=Gtk.MessageType.INFO,
-            buttons=Gtk.ButtonsType.OK,
-            text="Info",
-        )
+        if self._info_dialog is None:
+            self._info_dialog = Gtk.MessageDialog(
+                flags=0,
+                message_type=Gtk.MessageType.INFO,
+                buttons=Gtk.ButtonsType.OK,
+                text="Info",
+            )
+        self._run_message_dialog(self._info_dialog, message)
+
+    def _run_message_dialog(self, dialog: Gtk.MessageDialog, message: str):
+        reused = not dialog.get_visible()
+        if not reused:
+            # Already showing an earlier message inside its own run() loop;
+            # reusing it would overwrite that message and end both loops
+            dialog = Gtk.MessageDialog(
+                flags=0,
+                message_type=dialog.props.message_type,
+                buttons=Gtk.ButtonsType.OK,
+                text=dialog.props.text,
+            )
+
+        # The window may have been built since the dialog was created
+        dialog.set_transient_for(self.window)
         dialog.format_secondary_text(message)
         dialog.run()
-        dialog.destroy()
+        if reused:
+            dialog.hide()
+        else:
+            dialog.destroy()
+
+    def _pause_ui_timers(self):
+        if self.refresh_timeout_id:
+            GLib.source_remove(self.refresh_timeout_id)
+            self.refresh_timeout_id = None
+
+    def _resume_ui_timers(self):
+        self._sync_refresh_timer(self.manager.hotspot_active)
+        self._refresh_all()
 
     def _on_window_close(self, widget, event):
         self.window.hide()
+        self._pause_ui_timers()
         return True
 
     def _show_window(self):
-        if self.window:
-            self.window.show_all()
-            self.window.present()
+        self._ensure_window_built()
+        self.window.show_all()
+        self.window.present()
+        self._resume_ui_timers()
 
     def _on_quit(self, widget=None):
-        if self.status_timeout_id:
-            GLib.source_remove(self.status_timeout_id)
-        if self.clients_timeout_id:
-            GLib.source_remove(self.clients_timeout_id)
+        self._pause_ui_timers()
+        if self._pending_status_id:
+            GLib.source_remove(self._pending_status_id)
+        if self._network_changed_id:
+            Gio.NetworkMonitor.get_default().disconnect(self._network_changed_id)
+        for subscription_id in self._nm_subscription_ids:
+            self._nm.unsubscribe(subscription_id)
 
         if self.manager.hotspot_active:
             self.manager.stop_hotspot()
 
+        for dialog in (self._error_dialog, self._info_dialog):
+            if dialog:
+                dialog.destroy()
         if self.window:
             self.window.destroy()
 
         Gtk.main_quit()
 
     def run(self):
-        self.build_ui()
+        self._watch_network_changes()
+        # The window is built on first use; without a tray icon that is now
+        if self.indicator:
+            self._refresh_all()
+        else:
+            self._show_window()
         Gtk.main()
         return 0
 
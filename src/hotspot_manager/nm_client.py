@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+import gi
+
+gi.require_version("Gio", "2.0")
+
+from gi.repository import Gio, GLib
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Callable
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+NM_BUS_NAME = "org.freedesktop.NetworkManager"
+NM_PATH = "/org/freedesktop/NetworkManager"
+NM_IFACE = "org.freedesktop.NetworkManager"
+NM_DEVICE_IFACE = "org.freedesktop.NetworkManager.Device"
+NM_WIRELESS_IFACE = "org.freedesktop.NetworkManager.Device.Wireless"
+NM_ACCESS_POINT_IFACE = "org.freedesktop.NetworkManager.AccessPoint"
+DBUS_PROPERTIES_IFACE = "org.freedesktop.DBus.Properties"
+
+NM_DEVICE_TYPE_ETHERNET = 1
+NM_DEVICE_TYPE_WIFI = 2
+
+NM_DEVICE_STATE_ACTIVATED = 100
+
+NM_802_11_MODE_INFRA = 2
+NM_802_11_MODE_AP = 3
+
+
+@dataclass
+class NMDevice:
+    path: str
+    name: str
+    dev_type: int
+    state: int
+    managed: bool
+    active_connection: str
+
+    @property
+    def connected(self) -> bool:
+        return self.state == NM_DEVICE_STATE_ACTIVATED
+
+    @property
+    def is_wifi(self) -> bool:
+        return self.dev_type == NM_DEVICE_TYPE_WIFI
+
+    @property
+    def is_ethernet(self) -> bool:
+        return self.dev_type == NM_DEVICE_TYPE_ETHERNET
+
+
+class NetworkManagerClient:
+    def __init__(self):
+        self._bus: Optional[Gio.DBusConnection] = None
+
+    def _get_bus(self) -> Gio.DBusConnection:
+        if self._bus is None:
+            self._bus = Gio.bus_get_sync(Gio.BusType.SYSTEM, None)
+        return self._bus
+
+    def _call(
+        self,
+        path: str,
+        interface: str,
+        method: str,
+        args: Optional[GLib.Variant],
+        reply_type: str,
+    ) -> tuple:
+        reply = self._get_bus().call_sync(
+            NM_BUS_NAME,
+            path,
+            interface,
+            method,
+            args,
+            GLib.VariantType.new(reply_type),
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
+        )
+        return reply.unpack()
+
+    def get_properties(self, path: str, interface: str) -> Dict:
+        (props,) = self._call(
+            path,
+            DBUS_PROPERTIES_IFACE,
+            "GetAll",
+            GLib.Variant("(s)", (interface,)),
+            "(a{sv})",
+        )
+        return props
+
+    def _make_device(self, path: str) -> NMDevice:
+        props = self.get_properties(path, NM_DEVICE_IFACE)
+        return NMDevice(
+            path=path,
+            name=props.get("Interface", ""),
+            dev_type=props.get("DeviceType", 0),
+            state=props.get("State", 0),
+            managed=props.get("Managed", False),
+            active_connection=props.get("ActiveConnection", "/"),
+        )
+
+    def get_devices(self) -> List[NMDevice]:
+        try:
+            (paths,) = self._call(NM_PATH, NM_IFACE, "GetDevices", None, "(ao)")
+            return [self._make_device(path) for path in paths]
+        except GLib.Error as e:
+            logger.debug(f"NetworkManager GetDevices failed: {e.message}")
+            return []
+
+    def get_device(self, interface: str) -> Optional[NMDevice]:
+        try:
+            (path,) = self._call(
+                NM_PATH,
+                NM_IFACE,
+                "GetDeviceByIpIface",
+                GLib.Variant("(s)", (interface,)),
+                "(o)",
+            )
+            return self._make_device(path)
+        except GLib.Error as e:
+            logger.debug(f"NetworkManager has no device {interface}: {e.message}")
+            return None
+
+    def get_wireless_mode(self, device: NMDevice) -> Optional[int]:
+        try:
+            return self.get_properties(device.path, NM_WIRELESS_IFACE).get("Mode")
+        except GLib.Error:
+            return None
+
+    def get_active_ssid(self, device: NMDevice) -> Optional[str]:
+        try:
+            ap_path = self.get_properties(device.path, NM_WIRELESS_IFACE).get(
+                "ActiveAccessPoint", "/"
+            )
+            if ap_path == "/":
+                return None
+            ssid = self.get_properties(ap_path, NM_ACCESS_POINT_IFACE).get("Ssid")
+            return bytes(ssid).decode("utf-8", "replace") if ssid else None
+        except GLib.Error:
+            return None
+
+    def get_version(self) -> Optional[str]:
+        try:
+            return self.get_properties(NM_PATH, NM_IFACE).get("Version")
+        except GLib.Error:
+            return None
+
+    def _subscribe(
+        self,
+        interface: str,
+        member: str,
+        path: str,
+        arg0: Optional[str],
+        callback: Callable[[tuple], None],
+    ) -> Optional[int]:
+        def on_signal(connection, sender, path, interface, signal_name, params):
+            callback(params.unpack())
+
+        try:
+            return self._get_bus().signal_subscribe(
+                NM_BUS_NAME,
+                interface,
+                member,
+                path,
+                arg0,
+                Gio.DBusSignalFlags.NONE,
+                on_signal,
+            )
+        except GLib.Error as e:
+            logger.warning(f"Could not watch {path} {member}: {e.message}")
+            return None
+
+    def subscribe_device_state(
+        self, device: NMDevice, callback: Callable[[int, int], None]
+    ) -> Optional[int]:
+        return self._subscribe(
+            NM_DEVICE_IFACE,
+            "StateChanged",
+            device.path,
+            None,
+            lambda params: callback(params[0], params[1]),
+        )
+
+    def subscribe_properties_changed(
+        self, callback: Callable[[Dict], None]
+    ) -> Optional[int]:
+        return self._subscribe(
+            DBUS_PROPERTIES_IFACE,
+            "PropertiesChanged",
+            NM_PATH,
+            NM_IFACE,
+            lambda params: callback(params[1]),
+        )
+
+    def subscribe_manager_signal(
+        self, member: str, callback: Callable[[tuple], None]
+    ) -> Optional[int]:
+        return self._subscribe(NM_IFACE, member, NM_PATH, None, callback)
+
+    def unsubscribe(self, subscription_id: int):
+        if self._bus is not None:
+            self._bus.signal_unsubscribe(subscription_id)